@@ -1,5 +1,6 @@
-from fastapi import FastAPI, UploadFile, File, Form
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
 from backend.main import get_backend_service
 
@@ -46,6 +47,42 @@ def load_to_db(
     return {"success": success, "message": message}
 
 
+@app.get("/sessions/{session_id}/export")
+def export_session(session_id: str, export_format: str = Query("csv", alias="format")):
+    try:
+        stream, media_type, extension = backend.export_session(session_id, export_format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ImportError as e:
+        raise HTTPException(status_code=501, detail=f"Export format unavailable: {e}")
+
+    return StreamingResponse(
+        stream,
+        media_type=media_type,
+        headers={
+            "Content-Disposition":
+                f'attachment; filename="transactions_{session_id}.{extension}"'
+        }
+    )
+
+
+@app.post("/sessions/{session_id}/insights")
+def analyse_session(session_id: str):
+    try:
+        counts = backend.analyse_session(session_id)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return {"session_id": session_id, **counts}
+
+
+@app.get("/sessions/{session_id}/insights")
+def get_session_insights(session_id: str):
+    return {
+        "session_id": session_id,
+        "insights": backend.get_session_insights(session_id),
+    }
+
+
 @app.post("/clear")
 def clear_db():
     backend.clear_database()
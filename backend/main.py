@@ -1,17 +1,50 @@
 # Path: backend/main.py
 
+import io
 import os
+import mmap
 import uuid
 import shutil
+import threading
 from sqlalchemy import text
 
 from tools.tools import DataTransformer
-from database.connection import engine
+
+
+# Keep a copy of every raw upload (retention / audit only)
+PERSIST_RAW_UPLOADS = os.getenv("PERSIST_RAW_UPLOADS", "false").lower() == "true"
+
+
+def _upload_buffer(uploaded_file):
+    """
+    Returns a zero-copy buffer over the upload and a close callback.
+
+    - Streamlit UploadedFile / sample upload: getbuffer()
+    - FastAPI UploadFile: in-memory spool -> BytesIO buffer,
+      spool rolled to disk -> read-only mmap
+    """
+    if hasattr(uploaded_file, "getbuffer"):
+        return memoryview(uploaded_file.getbuffer()), lambda: None
+
+    spool = uploaded_file.file
+    inner = getattr(spool, "_file", spool)
+
+    if isinstance(inner, io.BytesIO):
+        view = inner.getbuffer()
+        return view, view.release
+
+    try:
+        mapped = mmap.mmap(inner.fileno(), 0, access=mmap.ACCESS_READ)
+        return mapped, mapped.close
+    except (OSError, ValueError, io.UnsupportedOperation):
+        inner.seek(0)
+        return memoryview(inner.read()), lambda: None
 
 
 class BackendService:
-    def __init__(self):
+    def __init__(self, persist_raw=PERSIST_RAW_UPLOADS):
         self.transformer = DataTransformer()
+        self.persist_raw = persist_raw
 
     # -------------------------------------------------
     # FILE PROCESSING
@@ -19,15 +52,15 @@ class BackendService:
     def process_file(self, uploaded_file, file_ext):
         session_id = str(uuid.uuid4())
 
-        temp_dir = os.path.join("uploaded_data", session_id)
-        os.makedirs(temp_dir, exist_ok=True)
-
-        temp_path = os.path.join(temp_dir, f"raw{file_ext}")
+        buffer, release = _upload_buffer(uploaded_file)
+        try:
+            if self.persist_raw:
+                self._persist_raw_async(bytes(buffer), session_id, file_ext)
 
-        with open(temp_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
+            df = self.transformer.parse_file(buffer, file_ext)
+        finally:
+            release()
 
-        df = self.transformer.parse_file(temp_path, file_ext)
         csv_path = self.transformer.export_csv(df, session_id)
 
         return {
@@ -36,6 +69,16 @@ class BackendService:
             "csv_path": csv_path,
         }
 
+    def _persist_raw_async(self, data, session_id, file_ext):
+        def _write():
+            temp_dir = os.path.join("uploaded_data", session_id)
+            os.makedirs(temp_dir, exist_ok=True)
+
+            with open(os.path.join(temp_dir, f"raw{file_ext}"), "wb") as f:
+                f.write(data)
+
+        threading.Thread(target=_write, daemon=True).start()
+
     # -------------------------------------------------
     # LOAD DATA INTO AZURE SQL
     # -------------------------------------------------
@@ -59,13 +102,40 @@ class BackendService:
             print("=" * 80)
             return False, f"❌ Load failed: {str(e)}"
 
+    # -------------------------------------------------
+    # EXPORT SESSION (STREAMED FROM AZURE SQL)
+    # -------------------------------------------------
+    def export_session(self, session_id, export_format="csv"):
+        # 🔧 LAZY IMPORT (same as loader, keeps DB optional at startup)
+        from tools.export_utils import stream_session_export
+
+        return stream_session_export(session_id, export_format)
+
+    # -------------------------------------------------
+    # RECURRING PAYMENTS / ANOMALIES
+    # -------------------------------------------------
+    def analyse_session(self, session_id):
+        from tools.recurring_analysis import analyse_session
+
+        return analyse_session(session_id)
+
+    def get_session_insights(self, session_id):
+        from tools.recurring_analysis import get_session_insights
+
+        return get_session_insights(session_id)
+
     # -------------------------------------------------
     # CLEAR DATABASE
     # -------------------------------------------------
     def clear_database(self):
         try:
+            # 🔧 LAZY IMPORT (module stays importable without DB config)
+            from database.connection import engine
+            from tools.recurring_analysis import delete_insights
+
             with engine.begin() as conn:
                 conn.execute(text("DELETE FROM FACT_TRANSACTIONS"))
+                delete_insights(conn)
 
             if os.path.exists("uploaded_data"):
                 shutil.rmtree("uploaded_data")
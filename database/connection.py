@@ -13,6 +13,7 @@ DB_NAME = os.getenv("DB_NAME")            # e.g. finance_analytics_db
 DB_USER = os.getenv("DB_USER")            # e.g. developer
 DB_PASSWORD = os.getenv("DB_PASSWORD")    # your password
 DB_DRIVER = os.getenv("DB_DRIVER")        # e.g. ODBC Driver 18 for SQL Server
+LOADTEST_DATABASE_URL = os.getenv("LOADTEST_DATABASE_URL")  # local stand-in, set only by tools/loadtest.py
 
 # ===== SAFETY CHECK =====
 missing = [k for k, v in {
@@ -23,7 +24,7 @@ missing = [k for k, v in {
     "DB_DRIVER": DB_DRIVER,
 }.items() if not v]
 
-if missing:
+if missing and not LOADTEST_DATABASE_URL:
     raise RuntimeError(f"Missing environment variables: {missing}")
 
 # ===== ODBC CONNECTION STRING =====
@@ -42,7 +43,7 @@ params = urllib.parse.quote_plus(odbc_str)
 
 # ===== SQLALCHEMY ENGINE =====
 engine = create_engine(
-    f"mssql+pyodbc:///?odbc_connect={params}",
+    LOADTEST_DATABASE_URL or f"mssql+pyodbc:///?odbc_connect={params}",
     pool_pre_ping=True,
     pool_size=5,
     max_overflow=10,
@@ -104,6 +104,50 @@ END;
 -- END TRIGGER
 
 
+/* ============================================================
+   STEP 5B: DERIVED TABLE – RECURRING PAYMENTS / ANOMALIES
+   Written by tools/recurring_analysis.py (one row per insight).
+   Azure SQL: run `python -m tools.recurring_analysis` once instead.
+   ============================================================ */
+
+CREATE TABLE C##FINANCE.FACT_TRANSACTION_INSIGHTS (
+    INSIGHT_ID            NUMBER NOT NULL,
+    SESSION_ID            VARCHAR2(64 BYTE) NOT NULL,
+    INSIGHT_TYPE          VARCHAR2(20 BYTE) NOT NULL,   -- RECURRING | ANOMALY
+    COUNTERPARTY_NAME     VARCHAR2(255 BYTE),
+    TXN_DATE              DATE,
+    AMOUNT                NUMBER(15,2),
+    PERIOD                VARCHAR2(20 BYTE),
+    PERIOD_DAYS           NUMBER,
+    OCCURRENCES           NUMBER,
+    SCORE                 NUMBER,
+    CREATED_AT            TIMESTAMP DEFAULT SYSTIMESTAMP
+);
+
+ALTER TABLE C##FINANCE.FACT_TRANSACTION_INSIGHTS
+ADD CONSTRAINT PK_FACT_TRANSACTION_INSIGHTS PRIMARY KEY (INSIGHT_ID);
+
+CREATE INDEX IDX_INSIGHTS_SESSION
+ON C##FINANCE.FACT_TRANSACTION_INSIGHTS (SESSION_ID);
+
+CREATE SEQUENCE C##FINANCE.FACT_INSIGHT_SEQ
+START WITH 1
+INCREMENT BY 1
+NOCACHE;
+
+CREATE OR REPLACE TRIGGER C##FINANCE.FACT_INSIGHT_BI
+BEFORE INSERT ON C##FINANCE.FACT_TRANSACTION_INSIGHTS
+FOR EACH ROW
+WHEN (NEW.INSIGHT_ID IS NULL)
+BEGIN
+    SELECT C##FINANCE.FACT_INSIGHT_SEQ.NEXTVAL
+    INTO :NEW.INSIGHT_ID
+    FROM dual;
+END;
+/
+-- END TRIGGER
+
+
 /* ============================================================
    STEP 6: (OPTIONAL) VERIFY
    ============================================================ */
@@ -0,0 +1,7 @@
+# Path: tests/conftest.py
+
+import os
+import sys
+
+# Allow `tools` / `backend` imports when running pytest from any directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
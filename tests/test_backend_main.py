@@ -0,0 +1,110 @@
+# Path: tests/test_backend_main.py
+
+import io
+import mmap
+import time
+import tempfile
+
+import pytest
+from starlette.datastructures import UploadFile
+
+from backend.main import BackendService, _upload_buffer
+
+STATEMENT = (
+    b"Txn Date,Description,Withdrawal,Deposit,Balance\n"
+    b"2025-04-13,UPI/111/PAY/AMAZON/HDFC/NOTE,500.0,0.0,9500.0\n"
+    b"2025-04-14,NEFT/222/SALARY/ACME/SBI/NOTE,0.0,1000.0,10500.0\n"
+)
+
+
+def upload(data, rolled=False):
+    """Starlette UploadFile over a spool, optionally rolled to disk."""
+    spool = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    spool.write(data)
+    if rolled:
+        spool.rollover()
+    spool.seek(0)
+    return UploadFile(spool, filename="statement.csv")
+
+
+class StreamlitUpload:
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def getbuffer(self):
+        return self._data.getbuffer()
+
+
+# -----------------------------
+# UPLOAD BUFFERS
+# -----------------------------
+def test_upload_buffer_in_memory_spool():
+    file = upload(STATEMENT)
+
+    buffer, release = _upload_buffer(file)
+
+    assert isinstance(file.file._file, io.BytesIO)
+    assert bytes(buffer) == STATEMENT
+    release()
+    file.file.close()
+
+
+def test_upload_buffer_rolled_over_spool_is_mapped():
+    file = upload(STATEMENT, rolled=True)
+
+    buffer, release = _upload_buffer(file)
+
+    assert isinstance(buffer, mmap.mmap)
+    assert buffer[:] == STATEMENT
+    release()
+    assert buffer.closed
+    file.file.close()
+
+
+@pytest.mark.parametrize("rolled", [False, True])
+def test_upload_buffer_empty_upload(rolled):
+    # An empty file cannot be mmapped: falls back to reading it
+    file = upload(b"", rolled=rolled)
+
+    buffer, release = _upload_buffer(file)
+
+    assert len(buffer) == 0
+    release()
+    file.file.close()
+
+
+def test_upload_buffer_streamlit_getbuffer():
+    buffer, release = _upload_buffer(StreamlitUpload(STATEMENT))
+
+    assert bytes(buffer) == STATEMENT
+    release()
+
+
+# -----------------------------
+# PROCESS FILE
+# -----------------------------
+@pytest.mark.parametrize("rolled", [False, True])
+def test_process_file_parses_upload_in_memory(tmp_path, monkeypatch, rolled):
+    monkeypatch.chdir(tmp_path)
+
+    result = BackendService(persist_raw=False).process_file(upload(STATEMENT, rolled), ".csv")
+
+    assert list(result["df"]["remarks"]) == [
+        "UPI/111/PAY/AMAZON/HDFC/NOTE", "NEFT/222/SALARY/ACME/SBI/NOTE",
+    ]
+    session_dir = tmp_path / "uploaded_data" / result["session_id"]
+    assert [p.name for p in session_dir.iterdir()] == ["cleaned_data.csv"]
+
+
+def test_process_file_persists_raw_upload(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    result = BackendService(persist_raw=True).process_file(upload(STATEMENT), ".csv")
+
+    raw = tmp_path / "uploaded_data" / result["session_id"] / "raw.csv"
+    deadline = time.monotonic() + 5
+    # Written on a background thread
+    while not (raw.exists() and raw.read_bytes() == STATEMENT) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert raw.read_bytes() == STATEMENT
@@ -0,0 +1,84 @@
+# Path: tests/test_export_utils.py
+
+import io
+import json
+import datetime
+from decimal import Decimal
+
+import pyarrow.parquet as pq
+
+from tools.export_utils import (
+    EXPORT_COLUMNS,
+    _stream_csv,
+    _stream_jsonl,
+    _stream_parquet,
+)
+
+
+def row(txn_date, debit, remarks="UPI/1/PAY/AMAZON/HDFC"):
+    values = dict.fromkeys(EXPORT_COLUMNS)
+    values.update({
+        "txn_date": txn_date,
+        "transaction_code": "UPI",
+        "debit": debit,
+        "credit": Decimal("0.00"),
+        "amount": -debit,
+        "balance": Decimal("9500.50"),
+        "remarks": remarks,
+    })
+    return tuple(values[c] for c in EXPORT_COLUMNS)
+
+
+def test_csv_header_only_for_empty_session():
+    output = b"".join(_stream_csv(iter([])))
+
+    assert output.decode("utf-8").strip() == ",".join(EXPORT_COLUMNS)
+
+
+def test_csv_one_piece_per_chunk():
+    chunks = [
+        [row(datetime.date(2025, 4, 1), Decimal("500.00"))],
+        [row(datetime.date(2025, 4, 2), Decimal("200.00"))],
+    ]
+
+    pieces = list(_stream_csv(iter(chunks)))
+    lines = b"".join(pieces).decode("utf-8").splitlines()
+
+    assert len(pieces) == 2
+    assert lines[0] == ",".join(EXPORT_COLUMNS)
+    assert lines[1].startswith("2025-04-01,")
+    assert "500.00" in lines[1]
+
+
+def test_jsonl_serialises_dates_and_decimals():
+    chunks = [[row(datetime.datetime(2025, 4, 1, 10, 30), Decimal("500.25"))]]
+
+    lines = b"".join(_stream_jsonl(iter(chunks))).decode("utf-8").splitlines()
+    record = json.loads(lines[0])
+
+    assert record["txn_date"] == "2025-04-01T10:30:00"
+    assert record["debit"] == 500.25
+    assert record["transaction_ref_id"] is None
+
+
+def test_parquet_row_group_per_chunk_and_mixed_date_types():
+    chunks = [
+        [row(datetime.date(2025, 4, 1), Decimal("500.00"))],
+        [row(datetime.datetime(2025, 4, 2, 9, 0), Decimal("200.00"))],
+        [row("2025-04-03 00:00:00", Decimal("100.00")), row(None, Decimal("1.00"))],
+    ]
+
+    data = b"".join(_stream_parquet(iter(chunks)))
+    parquet = pq.ParquetFile(io.BytesIO(data))
+    table = parquet.read().to_pandas()
+
+    assert parquet.num_row_groups == 3
+    assert list(table["debit"]) == [500.0, 200.0, 100.0, 1.0]
+    assert [str(d.date()) for d in table["txn_date"][:3]] == ["2025-04-01", "2025-04-02", "2025-04-03"]
+    assert table["txn_date"].isna().iloc[3]
+
+
+def test_parquet_empty_session_is_valid_file():
+    data = b"".join(_stream_parquet(iter([])))
+
+    assert pq.ParquetFile(io.BytesIO(data)).metadata.num_rows == 0
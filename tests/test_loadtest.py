@@ -0,0 +1,57 @@
+# Path: tests/test_loadtest.py
+
+import random
+
+import pytest
+
+from tools.loadtest import DEFAULT_MIX, parse_mix, percentile, synthetic_statement
+from tools.tools import DataTransformer
+
+
+# -----------------------------
+# STATS
+# -----------------------------
+def test_percentile_nearest_rank():
+    values = [1, 2, 3, 4, 5]
+
+    assert percentile(values, 50) == 3
+    assert percentile(values, 95) == 5
+    assert percentile(values, 100) == 5
+    assert percentile(values, 0) == 1
+
+
+def test_percentile_tail_of_hundred():
+    values = list(range(1, 101))
+
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+
+
+def test_percentile_empty():
+    assert percentile([], 50) is None
+
+
+# -----------------------------
+# MIX
+# -----------------------------
+def test_parse_mix_weights():
+    assert parse_mix(DEFAULT_MIX) == {"process": 6.0, "load": 3.0, "clear": 1.0}
+    # Missing weight defaults to 1
+    assert parse_mix(" process , load=2") == {"process": 1.0, "load": 2.0}
+
+
+def test_parse_mix_rejects_unknown_operation():
+    with pytest.raises(ValueError):
+        parse_mix("process=1,upload=2")
+
+
+# -----------------------------
+# SYNTHETIC STATEMENTS
+# -----------------------------
+@pytest.mark.parametrize("rows", [1, 40, 400])
+def test_synthetic_statement_keeps_every_row(rows):
+    payload = synthetic_statement(rows, random.Random(0))
+
+    df = DataTransformer().parse_file(payload, ".csv")
+
+    assert len(df) == rows
@@ -0,0 +1,282 @@
+# Path: tests/test_pdf_layouts.py
+
+import pytest
+
+from tools.pdf_layouts import (
+    LAYOUT_PROFILES,
+    _group_lines,
+    _split_columns,
+    extract_with_layout,
+)
+
+BOI_BOUNDS = [x0 for _, x0, _ in LAYOUT_PROFILES["BOI"]["columns"]]
+BOI_NAMES = [name for name, _, _ in LAYOUT_PROFILES["BOI"]["columns"]]
+
+
+# -----------------------------
+# FAKE PDFPLUMBER OBJECTS
+# -----------------------------
+def word(text, x0, top):
+    return {"text": text, "x0": x0, "x1": x0 + 5 * len(text), "top": top, "bottom": top + 8}
+
+
+class FakePage:
+    def __init__(self, words):
+        self._words = words
+
+    def extract_words(self, **kwargs):
+        return self._words
+
+
+class ExplodingPage:
+    def extract_words(self, **kwargs):
+        raise AssertionError("page should not be read")
+
+
+class FakePdf:
+    def __init__(self, pages):
+        self.pages = pages
+
+
+def boi_header(top):
+    return [
+        word("Sl", 10, top), word("No", 25, top),
+        word("Txn", 75, top), word("Date", 95, top),
+        word("Description", 140, top),
+        word("Cheque", 335, top), word("No", 368, top),
+        word("Withdrawal", 395, top),
+        word("Deposit", 465, top),
+        word("Balance", 530, top),
+    ]
+
+
+def boi_row(top, sl, date, remarks, debit="", credit="", balance=""):
+    words = [word(sl, 10, top), word(date, 75, top), word(remarks, 140, top)]
+    if debit:
+        words.append(word(debit, 400, top))
+    if credit:
+        words.append(word(credit, 470, top))
+    words.append(word(balance, 530, top))
+    return words
+
+
+# -----------------------------
+# HELPERS
+# -----------------------------
+def test_group_lines_within_tolerance():
+    words = [
+        word("B", 50, 101.5),
+        word("A", 10, 100),
+        word("C", 10, 120),
+    ]
+
+    lines = _group_lines(words, tolerance=3)
+
+    assert [[w["text"] for w in line] for line in lines] == [["A", "B"], ["C"]]
+
+
+def test_split_columns_uses_word_centre():
+    line = [
+        word("1", 10, 0),
+        word("01-04-2025", 75, 0),
+        word("UPI/1/PAY", 140, 0),
+        word("SHOP", 190, 0),
+        word("500.00", 400, 0),
+        word("9500.00", 530, 0),
+    ]
+
+    cells = _split_columns(line, BOI_BOUNDS)
+
+    assert cells == ["1", "01-04-2025", "UPI/1/PAY SHOP", "", "500.00", "", "9500.00"]
+
+
+# -----------------------------
+# EXTRACTOR
+# -----------------------------
+def test_extract_drops_repeated_headers_and_merges_continuations():
+    page_1 = FakePage(
+        [word("BANK", 10, 10), word("OF", 40, 10), word("INDIA", 60, 10)]
+        + boi_header(50)
+        + boi_row(70, "1", "01-04-2025", "UPI/111/PAY/AMAZON", debit="500.00", balance="9500.00")
+        + [word("/HDFC/NOTE", 140, 80)]
+        + boi_row(100, "2", "02-04-2025", "NEFT/222/SALARY", credit="1000.00", balance="10500.00")
+    )
+    page_2 = FakePage(
+        [word("Statement", 10, 10), word("Page", 80, 10), word("2", 110, 10)]
+        + boi_header(50)
+        + boi_row(70, "3", "03-04-2025", "UPI/333/PAY/SWIGGY", debit="200.00", balance="10300.00")
+        + [word("Total", 140, 300), word("700.00", 400, 300)]
+    )
+
+    df = extract_with_layout(FakePdf([page_1, page_2]))
+
+    assert list(df.columns) == BOI_NAMES
+    assert list(df["sl no"]) == ["1", "2", "3"]
+    assert df.loc[0, "description"] == "UPI/111/PAY/AMAZON\n/HDFC/NOTE"
+    assert list(df["withdrawal"]) == ["500.00", "", "200.00"]
+    assert list(df["deposit"]) == ["", "1000.00", ""]
+
+
+def test_extract_stops_at_footer_lines():
+    # Footer text sits in the description band, like the remarks it must not join
+    page = FakePage(
+        boi_header(50)
+        + boi_row(70, "1", "01-04-2025", "UPI/111/PAY/AMAZON/HDFC", debit="500.00", balance="9500.00")
+        + boi_row(100, "2", "02-04-2025", "UPI/222/PAY/SWIGGY/SBI", debit="200.00", balance="9300.00")
+        + [word("Total", 140, 130), word("700.00", 400, 130)]
+        + [word("**", 200, 160), word("End", 215, 160), word("of", 235, 160),
+           word("Statement", 250, 160), word("**", 300, 160)]
+        + [word("Page", 200, 780), word("1", 225, 780), word("of", 235, 780), word("2", 250, 780)]
+    )
+
+    df = extract_with_layout(FakePdf([page]))
+
+    assert list(df["description"]) == ["UPI/111/PAY/AMAZON/HDFC", "UPI/222/PAY/SWIGGY/SBI"]
+
+
+def test_extract_ignores_description_text_far_below_last_row():
+    page = FakePage(
+        boi_header(50)
+        + boi_row(70, "1", "01-04-2025", "UPI/111/PAY/AMAZON/HDFC", debit="500.00", balance="9500.00")
+        + [word("Page", 200, 780), word("1", 225, 780)]
+    )
+
+    df = extract_with_layout(FakePdf([page]))
+
+    assert list(df["description"]) == ["UPI/111/PAY/AMAZON/HDFC"]
+
+
+def test_extract_rejects_other_bank_header_after_first_page():
+    # SBI-style header: passes a loose keyword check, fails the band fingerprint
+    sbi_header = [
+        word("Txn", 10, 50), word("Date", 30, 50),
+        word("Value", 75, 50), word("Date", 105, 50),
+        word("Description", 140, 50),
+        word("Ref", 335, 50), word("No", 355, 50),
+        word("Debit", 400, 50),
+        word("Credit", 470, 50),
+        word("Balance", 530, 50),
+    ]
+    pdf = FakePdf([
+        FakePage(sbi_header + boi_row(70, "1", "01-04-2025", "UPI/1/X", debit="5", balance="5")),
+        ExplodingPage(),
+    ])
+
+    assert extract_with_layout(pdf).empty
+
+
+def test_extract_columns_map_to_canonical_names():
+    from tools.tools import DataTransformer
+
+    pdf = FakePdf([FakePage(
+        boi_header(50)
+        + boi_row(70, "1", "01-04-2025", "UPI/111/PAY/AMAZON", debit="1,500.00", balance="9500.00")
+    )])
+
+    df = DataTransformer()._clean_dataframe(extract_with_layout(pdf))
+
+    assert {"transaction_date", "remarks", "debit", "credit", "balance"} <= set(df.columns)
+    assert df.loc[0, "debit"] == pytest.approx(1500.0)
+    assert df.loc[0, "credit"] == 0
+
+
+# -----------------------------
+# REAL PDF: LAYOUT PATH vs TABLE DETECTION
+# -----------------------------
+BOI_COL_WIDTHS = (50, 65, 195, 60, 70, 65, 50)
+
+
+def build_boi_pdf(path, rows):
+    """
+    Ruled BOI-style statement: banner, table with repeated headings on
+    every page, multi-line remarks, page footer and end marker.
+    """
+    fpdf = pytest.importorskip("fpdf")
+    from fpdf.enums import VAlign
+
+    class StatementPDF(fpdf.FPDF):
+        def footer(self):
+            self.set_y(-30)
+            self.set_font("Helvetica", size=7)
+            self.cell(0, 10, f"Page {self.page_no()} of {{nb}}", align="C")
+
+    pdf = StatementPDF(unit="pt", format="A4")
+    pdf.set_margins(20, 30, 20)
+    pdf.set_auto_page_break(True, 50)
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=7)
+    pdf.cell(0, 12, "BANK OF INDIA", new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(0, 12, "Statement of Account", new_x="LMARGIN", new_y="NEXT")
+
+    balance = 50000.0
+    with pdf.table(
+        width=sum(BOI_COL_WIDTHS), col_widths=BOI_COL_WIDTHS, align="LEFT",
+        v_align=VAlign.T, text_align="LEFT", line_height=9, repeat_headings=1,
+    ) as table:
+        header = table.row()
+        for text in ["Sl No", "Txn Date", "Description", "Cheque No", "Withdrawal", "Deposit", "Balance"]:
+            header.cell(text)
+
+        for i in range(rows):
+            is_debit = i % 3 != 0
+            amount = 100 + i
+            balance += -amount if is_debit else amount
+            remarks = f"UPI/{1000 + i}/PAY/SHOP{i % 7}/HDFC" + ("\n/NOTE/EXTRA" if i % 4 == 0 else "")
+
+            row = table.row()
+            for text in [
+                str(i + 1),
+                f"{1 + i % 12:02d}-{1 + (i // 12) % 12:02d}-2025",
+                remarks,
+                "12345" if i % 5 == 0 else "",
+                f"{amount:.2f}" if is_debit else "",
+                "" if is_debit else f"{amount:.2f}",
+                f"{balance:.2f}",
+            ]:
+                row.cell(text)
+
+    pdf.cell(0, 12, "** End of Statement **", align="C")
+    pdf.output(str(path))
+
+
+def test_layout_path_matches_table_detection_on_real_pdf(tmp_path):
+    import pdfplumber
+    from tools.pdf_layouts import extract_layout_from_source
+    from tools.tools import DataTransformer
+
+    path = tmp_path / "boi.pdf"
+    build_boi_pdf(path, rows=120)
+
+    fast = extract_layout_from_source(str(path))
+
+    generic = DataTransformer()
+    generic.PDF_LAYOUT = None
+    table = generic._parse_pdf(str(path))
+
+    with pdfplumber.open(str(path)) as pdf:
+        assert len(pdf.pages) > 1
+        # pdfium word source agrees with pdfplumber's word stream
+        pd_words = extract_with_layout(pdf)
+
+    assert len(fast) == 120
+    assert fast.equals(pd_words)
+    assert fast.loc[0, "description"] == "UPI/1000/PAY/SHOP0/HDFC\n/NOTE/EXTRA"
+
+    cleaner = DataTransformer()
+    cleaned_fast = cleaner._clean_dataframe(fast.copy())
+    cleaned_table = cleaner._clean_dataframe(table.copy())
+    assert cleaned_fast.reset_index(drop=True).equals(cleaned_table.reset_index(drop=True))
+
+
+def test_parse_file_uses_layout_path_for_buffers(tmp_path):
+    from tools.tools import DataTransformer
+
+    path = tmp_path / "boi.pdf"
+    build_boi_pdf(path, rows=10)
+
+    transformer = DataTransformer()
+    from_buffer = transformer.parse_file(memoryview(path.read_bytes()), ".pdf")
+    from_path = transformer.parse_file(str(path), ".pdf")
+
+    assert len(from_buffer) == 10
+    assert from_buffer.equals(from_path)
@@ -0,0 +1,144 @@
+# Path: tests/test_recurring_analysis.py
+
+import pandas as pd
+
+from tools.recurring_analysis import (
+    ANOMALY_Z,
+    MIN_SCALE_RATIO,
+    detect_anomalies,
+    detect_recurring,
+    normalize_counterparty,
+)
+
+
+def frame(rows):
+    """rows: (date, counterparty, debit)"""
+    df = pd.DataFrame(rows, columns=["txn_date", "counterparty", "debit"])
+    df["txn_date"] = pd.to_datetime(df["txn_date"])
+    return df
+
+
+def test_normalize_counterparty():
+    names = pd.Series(["Netflix.com 0421", "NETFLIXCOM", None, "1234"])
+
+    assert list(normalize_counterparty(names)) == ["NETFLIXCOM", "NETFLIXCOM", "UNKNOWN", "UNKNOWN"]
+
+
+# -----------------------------
+# RECURRING
+# -----------------------------
+def test_detect_recurring_finds_monthly_payment():
+    df = frame([
+        ("2025-01-05", "NETFLIX", 199.0),
+        ("2025-02-05", "NETFLIX", 199.0),
+        ("2025-03-05", "NETFLIX", 199.0),
+        ("2025-04-05", "NETFLIX", 199.0),
+        # Irregular timing and amounts
+        ("2025-01-01", "SHOP", 100.0),
+        ("2025-01-03", "SHOP", 2500.0),
+        ("2025-02-20", "SHOP", 40.0),
+        # No counterparty: never grouped
+        ("2025-01-10", "UNKNOWN", 50.0),
+        ("2025-02-10", "UNKNOWN", 50.0),
+        ("2025-03-10", "UNKNOWN", 50.0),
+    ])
+
+    result = detect_recurring(df)
+
+    assert list(result["counterparty_name"]) == ["NETFLIX"]
+    row = result.iloc[0]
+    assert row["period"] == "MONTHLY"
+    assert row["occurrences"] == 4
+    assert row["amount"] == 199.0
+    assert row["txn_date"] == pd.Timestamp("2025-04-05")
+
+
+def test_detect_recurring_needs_min_occurrences():
+    df = frame([
+        ("2025-01-05", "GYM", 999.0),
+        ("2025-02-05", "GYM", 999.0),
+    ])
+
+    assert detect_recurring(df).empty
+
+
+def test_detect_recurring_rejects_unstable_amounts():
+    df = frame([
+        ("2025-01-05", "CARD", 100.0),
+        ("2025-02-05", "CARD", 900.0),
+        ("2025-03-05", "CARD", 300.0),
+        ("2025-04-05", "CARD", 50.0),
+    ])
+
+    assert detect_recurring(df).empty
+
+
+def test_detect_recurring_tolerates_one_outlier_charge():
+    months = ["01", "02", "03", "04", "05", "06", "07"]
+    amounts = [199.0, 199.0, 199.0, 5000.0, 199.0, 199.0, 199.0]
+    df = frame([(f"2025-{m}-05", "NETFLIX", a) for m, a in zip(months, amounts)])
+
+    recurring = detect_recurring(df)
+
+    assert list(recurring["counterparty_name"]) == ["NETFLIX"]
+    assert recurring.iloc[0]["amount"] == 199.0
+    assert recurring.iloc[0]["occurrences"] == 7
+    # ... while the odd charge itself is still an anomaly
+    assert list(detect_anomalies(df)["amount"]) == [5000.0]
+
+
+# -----------------------------
+# ANOMALIES
+# -----------------------------
+def test_detect_anomalies_flags_spike_after_steady_run():
+    df = frame([
+        ("2025-01-05", "NETFLIX", 199.0),
+        ("2025-02-05", "NETFLIX", 199.0),
+        ("2025-03-05", "NETFLIX", 199.0),
+        ("2025-04-05", "NETFLIX", 5000.0),
+    ])
+
+    result = detect_anomalies(df)
+
+    assert list(result["amount"]) == [5000.0]
+    assert list(result["txn_date"]) == [pd.Timestamp("2025-04-05")]
+    assert (result["score"] > 3).all()
+
+
+def test_detect_anomalies_ignores_small_variation():
+    df = frame([
+        ("2025-01-05", "POWER", 1200.0),
+        ("2025-02-05", "POWER", 1180.0),
+        ("2025-03-05", "POWER", 1210.0),
+        ("2025-04-05", "POWER", 1250.0),
+    ])
+
+    assert detect_anomalies(df).empty
+
+
+def test_detect_anomalies_needs_baseline():
+    df = frame([
+        ("2025-01-05", "SHOP", 10.0),
+        ("2025-01-06", "SHOP", 9000.0),
+    ])
+
+    assert detect_anomalies(df).empty
+
+
+def test_detect_anomalies_threshold_after_steady_run():
+    # With std = 0 the scale is the floor, so the cut-off is
+    # baseline * (1 + ANOMALY_Z * MIN_SCALE_RATIO) = 1.75x
+    assert 1 + ANOMALY_Z * MIN_SCALE_RATIO == 1.75
+
+    def spike(amount):
+        return frame([
+            ("2025-01-05", "NETFLIX", 199.0),
+            ("2025-02-05", "NETFLIX", 199.0),
+            ("2025-03-05", "NETFLIX", 199.0),
+            ("2025-04-05", "NETFLIX", amount),
+        ])
+
+    # Price rise: a level shift, not an anomaly
+    assert detect_anomalies(spike(260.0)).empty
+    assert detect_anomalies(spike(199.0 * 1.7)).empty
+    assert list(detect_anomalies(spike(199.0 * 1.8))["amount"]) == [199.0 * 1.8]
@@ -0,0 +1,78 @@
+# Path: tests/test_tools.py
+
+import io
+
+import openpyxl
+
+from tools.tools import DataTransformer, MemoryReader
+
+
+def _write_statement(path, rows):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["BANK OF INDIA"])
+    ws.append(["Statement for A/C 1234"])
+    ws.append(["Txn Date", "Description", "Withdrawal", "Deposit", "Balance"])
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+
+
+def test_fast_excel_skips_banner_rows(tmp_path):
+    path = tmp_path / "statement.xlsx"
+    _write_statement(path, [
+        ["13/04/2025", "UPI/1/PAY/AMAZON", 500.0, None, 9500.0],
+        ["14/04/2025", "NEFT/2/SALARY", None, 1000.0, 10500.0],
+    ])
+
+    df = DataTransformer().parse_file(str(path), ".xlsx")
+
+    assert list(df["remarks"]) == ["UPI/1/PAY/AMAZON", "NEFT/2/SALARY"]
+    assert list(df["debit"]) == [500.0, 0]
+    assert list(df["credit"]) == [0, 1000.0]
+
+
+def test_fast_excel_parses_text_dates_alike_across_chunks(tmp_path):
+    path = tmp_path / "statement.xlsx"
+    # First chunk is unambiguous day-first; the second would be read
+    # month-first if the format were guessed again per chunk
+    _write_statement(path, [
+        ["13/04/2025", "UPI/1/PAY/AMAZON", 500.0, None, 9500.0],
+        ["05/04/2025", "UPI/2/PAY/SWIGGY", 200.0, None, 9300.0],
+    ])
+
+    transformer = DataTransformer()
+    transformer.EXCEL_CHUNK_SIZE = 1
+    df = transformer.parse_file(str(path), ".xlsx")
+
+    assert [d.month for d in df["transaction_date"]] == [4, 4]
+    assert [d.day for d in df["transaction_date"]] == [13, 5]
+
+
+# -----------------------------
+# IN-MEMORY READER
+# -----------------------------
+def test_memory_reader_seek_and_readinto():
+    reader = MemoryReader(memoryview(b"0123456789"))
+
+    buf = bytearray(4)
+    assert reader.readinto(buf) == 4
+    assert bytes(buf) == b"0123"
+
+    assert reader.seek(-3, io.SEEK_END) == 7
+    assert reader.readinto(buf) == 3
+    assert bytes(buf[:3]) == b"789"
+    assert reader.readinto(buf) == 0
+
+    assert reader.seek(-100, io.SEEK_CUR) == 0
+    assert reader.seek(2) == 2
+    assert io.BufferedReader(reader).read() == b"23456789"
+
+
+def test_memory_reader_does_not_release_caller_buffer():
+    data = bytearray(b"abc")
+    view = memoryview(data)
+
+    MemoryReader(view).close()
+
+    assert bytes(view) == b"abc"
@@ -4,6 +4,7 @@ import os
 import shutil
 from sqlalchemy import text
 from database.connection import engine
+from tools.recurring_analysis import delete_insights
 
 
 def cleanup_session_data(session_id=None, cleanup_all=False):
@@ -24,6 +25,7 @@ def cleanup_session_data(session_id=None, cleanup_all=False):
                     text("DELETE FROM FACT_TRANSACTIONS")
                 )
                 deleted = result.rowcount
+                delete_insights(conn)
 
             elif session_id:
                 result = conn.execute(
@@ -33,6 +35,7 @@ def cleanup_session_data(session_id=None, cleanup_all=False):
                     {"sid": session_id}
                 )
                 deleted = result.rowcount
+                delete_insights(conn, session_id)
             else:
                 return False, "No cleanup option provided"
 
@@ -0,0 +1,225 @@
+# Path: tools/export_utils.py
+
+import io
+import csv
+import json
+import itertools
+import pandas as pd
+from sqlalchemy import text
+
+# -----------------------------
+# EXPORT SETTINGS
+# -----------------------------
+EXPORT_COLUMNS = [
+    "txn_date",
+    "transaction_ref_id",
+    "transaction_code",
+    "transaction_method",
+    "transaction_category",
+    "transaction_nature",
+    "counterparty_name",
+    "counterparty_bank_code",
+    "debit",
+    "credit",
+    "amount",
+    "balance",
+    "remarks",
+]
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+# -----------------------------
+# SERVER-SIDE CURSOR
+# -----------------------------
+def iter_session_chunks(session_id: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Streams FACT_TRANSACTIONS rows of one session in fixed-size chunks.
+
+    Uses a server-side cursor (stream_results + yield_per) so only one
+    chunk is held in memory at a time.
+
+    Yields:
+        list of row tuples (ordered as EXPORT_COLUMNS)
+    """
+    # 🔧 LAZY IMPORT (writers stay usable without DB config)
+    from database.connection import engine
+
+    query = text(f"""
+        SELECT {", ".join(EXPORT_COLUMNS)}
+        FROM FACT_TRANSACTIONS
+        WHERE session_id = :sid
+        ORDER BY txn_date, txn_id
+    """)
+
+    with engine.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True,
+            yield_per=chunk_size,
+        ).execute(query, {"sid": session_id})
+
+        for partition in result.partitions():
+            yield partition
+
+
+def _json_default(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return float(value)
+
+
+# -----------------------------
+# FORMAT WRITERS
+# -----------------------------
+def _stream_csv(chunks):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    # Header only (empty session)
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _stream_jsonl(chunks):
+    for rows in chunks:
+        lines = [
+            json.dumps(dict(zip(EXPORT_COLUMNS, row)), default=_json_default)
+            for row in rows
+        ]
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only file object that hands written bytes back to the caller
+    instead of keeping them, so parquet row groups can be streamed.
+    """
+
+    def __init__(self):
+        self._pending = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._pending.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._pending)
+        self._pending = []
+        return data
+
+
+def _stream_parquet(chunks):
+    # 🔧 LAZY IMPORT (pyarrow is only needed for parquet exports)
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("txn_date", pa.timestamp("ms")),
+        ("transaction_ref_id", pa.string()),
+        ("transaction_code", pa.string()),
+        ("transaction_method", pa.string()),
+        ("transaction_category", pa.string()),
+        ("transaction_nature", pa.string()),
+        ("counterparty_name", pa.string()),
+        ("counterparty_bank_code", pa.string()),
+        ("debit", pa.float64()),
+        ("credit", pa.float64()),
+        ("amount", pa.float64()),
+        ("balance", pa.float64()),
+        ("remarks", pa.string()),
+    ])
+    numeric = {"debit", "credit", "amount", "balance"}
+
+    def _column(name, values):
+        if name == "txn_date":
+            # DATE / DATETIME / text depending on the backend: normalise
+            dates = pd.to_datetime(pd.Series(values, dtype=object), errors="coerce")
+            return pa.array(dates.dt.floor("ms"), type=pa.timestamp("ms"), from_pandas=True)
+        if name in numeric:
+            return [None if v is None else float(v) for v in values]
+        return [None if v is None else str(v) for v in values]
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+
+    try:
+        for rows in chunks:
+            columns = list(zip(*rows))
+            arrays = [
+                _column(name, values)
+                for name, values in zip(EXPORT_COLUMNS, columns)
+            ]
+            # One row group per fetched chunk
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+
+    yield sink.drain()
+
+
+_WRITERS = {
+    "csv": _stream_csv,
+    "jsonl": _stream_jsonl,
+    "parquet": _stream_parquet,
+}
+
+
+# -----------------------------
+# PUBLIC ENTRY POINT
+# -----------------------------
+def stream_session_export(session_id: str, export_format: str = "csv",
+                          chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Builds a byte stream of one session's enriched transactions.
+
+    Args:
+        session_id (str): session to export
+        export_format (str): csv | jsonl | parquet
+        chunk_size (int): rows fetched per cursor round-trip
+
+    Returns:
+        (byte iterator, media_type: str, file_extension: str)
+
+    Raises:
+        ValueError: unknown export format
+        ImportError: parquet requested but pyarrow is not installed
+        Database errors from the first fetch, before any byte is streamed
+    """
+    if export_format not in _WRITERS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    if export_format == "parquet":
+        import pyarrow  # noqa: F401  (fail before the response starts)
+
+    media_type, extension = EXPORT_FORMATS[export_format]
+    stream = _WRITERS[export_format](iter_session_chunks(session_id, chunk_size))
+
+    # Pull the first chunk now: the response status is sent before the
+    # body is iterated, so connection / query errors must surface here
+    first = next(stream, b"")
+
+    return itertools.chain([first], stream), media_type, extension
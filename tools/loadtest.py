@@ -0,0 +1,366 @@
+# Path: tools/loadtest.py
+"""
+Concurrent load test for the FastAPI backend.
+
+Drives a weighted mix of /process, /load and /clear with synthetic
+statements at a target concurrency and reports p50/p95/p99 latency,
+throughput and error rate per endpoint.
+
+Usage:
+    # In-process uvicorn + local SQLite stand-in for Azure SQL
+    python -m tools.loadtest --concurrency 16 --requests 400
+
+    # Against an already running server
+    python -m tools.loadtest --base-url http://127.0.0.1:9000 --output run.json
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+DEFAULT_MIX = "process=6,load=3,clear=1"
+
+COUNTERPARTIES = ["AMAZON", "SWIGGY", "RELIANCE", "LIC", "HDFCSIP", "RAHUL", "AIRTEL"]
+BANKS = ["BOI", "HDFC", "SBI", "AXIS", "ICICI"]
+
+# -----------------------------
+# LOCAL DB STAND-IN
+# -----------------------------
+STANDIN_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS dbo.fact_transactions (
+        txn_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id TEXT NOT NULL,
+        txn_date TIMESTAMP,
+        transaction_ref_id TEXT,
+        transaction_code TEXT,
+        transaction_method TEXT,
+        transaction_category TEXT,
+        transaction_nature TEXT,
+        counterparty_name TEXT,
+        counterparty_bank_code TEXT,
+        debit REAL,
+        credit REAL,
+        amount REAL,
+        balance REAL,
+        remarks TEXT,
+        created_at TIMESTAMP
+    )
+"""
+
+
+def setup_standin_db(work_dir: str):
+    """
+    Points database.connection at a SQLite file that mimics the Azure SQL
+    schema: the data file is attached as `dbo`, so both
+    `dbo.fact_transactions` and unqualified `FACT_TRANSACTIONS` resolve.
+
+    Must run before backend modules are imported.
+    """
+    import pandas as pd
+    from sqlalchemy import event, text
+
+    main_path = os.path.join(work_dir, "main.db")
+    dbo_path = os.path.join(work_dir, "dbo.db")
+    os.environ["LOADTEST_DATABASE_URL"] = f"sqlite:///{main_path}?check_same_thread=false"
+
+    sqlite3.register_adapter(pd.Timestamp, lambda ts: ts.isoformat(" "))
+
+    from database.connection import engine
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, _):
+        dbapi_conn.execute(f"ATTACH DATABASE '{dbo_path}' AS dbo")
+        dbapi_conn.execute("PRAGMA dbo.journal_mode=WAL")
+        dbapi_conn.execute("PRAGMA busy_timeout=30000")
+        dbapi_conn.create_function("GETDATE", 0, lambda: time.strftime("%Y-%m-%d %H:%M:%S"))
+
+    with engine.begin() as conn:
+        conn.execute(text(STANDIN_SCHEMA))
+
+
+# -----------------------------
+# SYNTHETIC STATEMENTS
+# -----------------------------
+def synthetic_statement(rows: int, rng: random.Random) -> bytes:
+    """
+    Builds a BOI-like CSV statement that passes DataTransformer cleaning.
+    """
+    lines = ["Txn Date,Description,Withdrawal,Deposit,Balance"]
+    balance = 50000.0
+
+    for i in range(rows):
+        day = 1 + i % 28
+        month = 1 + (i // 28) % 12
+        party = rng.choice(COUNTERPARTIES)
+        bank = rng.choice(BANKS)
+        ref = rng.randint(100000000, 999999999)
+
+        if rng.random() < 0.7:
+            debit, credit = round(rng.uniform(10, 5000), 2), 0.0
+        else:
+            debit, credit = 0.0, round(rng.uniform(100, 20000), 2)
+        balance += credit - debit
+
+        remarks = f"UPI/{ref}/PAYMENT/{party}/{bank}/NOTE"
+        # ISO dates: unambiguous, so no day-first/month-first guess drops rows
+        lines.append(f"2025-{month:02d}-{day:02d},{remarks},{debit},{credit},{balance:.2f}")
+
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+# -----------------------------
+# STATS
+# -----------------------------
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    # Nearest-rank
+    idx = min(len(sorted_values) - 1, max(0, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[idx]
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.skipped = defaultdict(int)
+        self.sessions = []
+
+    def record(self, endpoint, seconds, ok):
+        with self._lock:
+            self.latencies[endpoint].append(seconds * 1000)
+            if not ok:
+                self.errors[endpoint] += 1
+
+    def skip(self, endpoint):
+        with self._lock:
+            self.skipped[endpoint] += 1
+
+    def add_session(self, session_id, csv_path):
+        with self._lock:
+            self.sessions.append((session_id, csv_path))
+
+    def pick_session(self, rng):
+        with self._lock:
+            return rng.choice(self.sessions) if self.sessions else None
+
+    def reset_sessions(self):
+        with self._lock:
+            self.sessions.clear()
+
+    def summary(self, wall_seconds):
+        endpoints = {}
+        for endpoint in sorted(set(self.latencies) | set(self.skipped)):
+            values = sorted(self.latencies.get(endpoint, []))
+            count = len(values)
+            endpoints[endpoint] = {
+                "count": count,
+                "skipped": self.skipped[endpoint],
+                "errors": self.errors[endpoint],
+                "error_rate": self.errors[endpoint] / count if count else 0.0,
+                "throughput_rps": count / wall_seconds if wall_seconds else 0.0,
+                "p50_ms": percentile(values, 50),
+                "p95_ms": percentile(values, 95),
+                "p99_ms": percentile(values, 99),
+                "max_ms": values[-1] if values else None,
+            }
+        return endpoints
+
+
+# -----------------------------
+# OPERATIONS
+# -----------------------------
+def _timed(recorder, endpoint, call, check=None):
+    start = time.perf_counter()
+    try:
+        response = call()
+        ok = response.status_code < 400 and (check is None or check(response.json()))
+    except Exception:
+        response, ok = None, False
+    recorder.record(endpoint, time.perf_counter() - start, ok)
+    return response if ok else None
+
+
+def op_process(client, recorder, rng, rows):
+    payload = synthetic_statement(rows, rng)
+    response = _timed(
+        recorder, "/process",
+        lambda: client.post(
+            "/process",
+            files={"file": ("statement.csv", payload, "text/csv")},
+            data={"file_ext": ".csv"},
+        ),
+    )
+    if response is not None:
+        body = response.json()
+        recorder.add_session(body["session_id"], body["csv_path"])
+
+
+def op_load(client, recorder, rng, rows):
+    session = recorder.pick_session(rng)
+    if session is None:
+        # Nothing processed yet: a load needs a cleaned CSV first.
+        # Counted as skipped so the requested mix is not skewed.
+        recorder.skip("/load")
+        return
+
+    session_id, csv_path = session
+    _timed(
+        recorder, "/load",
+        lambda: client.post("/load", data={"session_id": session_id, "csv_path": csv_path}),
+        check=lambda body: body.get("success", False),
+    )
+
+
+def op_clear(client, recorder, rng, rows):
+    if _timed(recorder, "/clear", lambda: client.post("/clear")) is not None:
+        recorder.reset_sessions()
+
+
+OPERATIONS = {
+    "process": op_process,
+    "load": op_load,
+    "clear": op_clear,
+}
+
+
+def parse_mix(mix: str):
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation in mix: {name}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+# -----------------------------
+# SERVER
+# -----------------------------
+def start_inprocess_server(port: int):
+    """
+    Runs backend.api:app with uvicorn on a background thread.
+    """
+    import uvicorn
+    from backend.api import app
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("Uvicorn failed to start")
+        time.sleep(0.05)
+
+    return server, thread
+
+
+# -----------------------------
+# RUNNER
+# -----------------------------
+def run_load_test(base_url, concurrency, total_requests, mix, rows, seed):
+    weights = parse_mix(mix)
+    names = list(weights)
+    recorder = Recorder()
+    plan_rng = random.Random(seed)
+    plan = plan_rng.choices(names, weights=[weights[n] for n in names], k=total_requests)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    with httpx.Client(base_url=base_url, timeout=300, limits=limits) as client:
+        def worker(index, name):
+            rng = random.Random(seed + index)
+            OPERATIONS[name](client, recorder, rng, rows)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(worker, range(total_requests), plan))
+        wall = time.perf_counter() - start
+
+    return {
+        "config": {
+            "base_url": base_url,
+            "concurrency": concurrency,
+            "requests": total_requests,
+            "mix": weights,
+            "rows_per_statement": rows,
+            "seed": seed,
+        },
+        "wall_seconds": wall,
+        "throughput_rps": total_requests / wall if wall else 0.0,
+        "endpoints": recorder.summary(wall),
+    }
+
+
+def print_report(results):
+    print(f"\nConcurrency {results['config']['concurrency']} | "
+          f"{results['config']['requests']} requests in {results['wall_seconds']:.2f}s "
+          f"({results['throughput_rps']:.1f} req/s)")
+    print(f"{'endpoint':<10}{'count':>7}{'skipped':>9}{'err %':>8}{'rps':>8}"
+          f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+
+    def ms(value):
+        return f"{value:>10.1f}" if value is not None else f"{'-':>10}"
+
+    for endpoint, s in results["endpoints"].items():
+        print(f"{endpoint:<10}{s['count']:>7}{s['skipped']:>9}{s['error_rate'] * 100:>8.1f}"
+              f"{s['throughput_rps']:>8.1f}{ms(s['p50_ms'])}{ms(s['p95_ms'])}{ms(s['p99_ms'])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the Finance Transaction Analyzer API")
+    parser.add_argument("--base-url", help="Target a running server instead of starting one in-process")
+    parser.add_argument("--port", type=int, default=9100, help="Port for the in-process server")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Weighted mix, e.g. process=6,load=3,clear=1")
+    parser.add_argument("--rows", type=int, default=500, help="Transactions per synthetic statement")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    server = None
+    base_url = args.base_url
+    output = os.path.abspath(args.output) if args.output else None
+
+    if base_url is None:
+        sys.path.insert(0, REPO_ROOT)
+        work_dir = tempfile.mkdtemp(prefix="fta_load_")
+        # uploaded_data/ is relative to CWD; keep it away from real sessions
+        os.chdir(work_dir)
+        setup_standin_db(work_dir)
+        server, _ = start_inprocess_server(args.port)
+        base_url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        results = run_load_test(base_url, args.concurrency, args.requests, args.mix, args.rows, args.seed)
+    finally:
+        if server is not None:
+            server.should_exit = True
+
+    print_report(results)
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+# Path: tools/pdf_layouts.py
+
+import re
+import pandas as pd
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_raw
+
+# -----------------------------
+# LAYOUT PROFILES
+# -----------------------------
+# x-boundaries are PDF points (A4 portrait = 595pt wide).
+# Each column owns the band [x0, next x0); a word belongs to the band
+# its horizontal centre falls into.
+LAYOUT_PROFILES = {
+    "BOI": {
+        # (column name, band x0, header pattern)
+        # Names match DataTransformer.CANONICAL_MAP; the header line must
+        # match every band's pattern for the layout to be used.
+        "columns": [
+            ("sl no", 0, r"^s\.?\s*l\.?\s*no"),
+            ("txn date", 70, r"^(txn|transaction)\s*date$"),
+            ("description", 135, r"^(description|particulars|narration)$"),
+            ("cheque no", 330, r"^(cheque|chq)\.?\s*no"),
+            ("withdrawal", 390, r"^withdrawals?\b"),
+            ("deposit", 460, r"^deposits?\b"),
+            ("balance", 525, r"^balance\b"),
+        ],
+        "date_column": "txn date",
+        "continuation_column": "description",
+        "date_pattern": r"^\d{2}[-/]\d{2}[-/]\d{2,4}$",
+        "line_tolerance": 3,
+        # A continuation line must start within this many line heights
+        # of the previous line of the same row
+        "continuation_spacing": 1.6,
+        # ... and be left-aligned with the row's remarks (points)
+        "continuation_indent": 6,
+    },
+}
+
+
+# -----------------------------
+# HELPERS
+# -----------------------------
+def _group_lines(words, tolerance):
+    """
+    Groups pdfplumber words into visual lines by their `top` coordinate.
+    """
+    lines = []
+    for word in sorted(words, key=lambda w: (round(w["top"]), w["x0"])):
+        if lines and abs(word["top"] - lines[-1][0]) <= tolerance:
+            lines[-1][1].append(word)
+        else:
+            lines.append((word["top"], [word]))
+    return [line_words for _, line_words in lines]
+
+
+def _split_columns(line_words, bounds):
+    """
+    Assigns words of one line to profile columns.
+
+    Returns:
+        list of cell strings (one per column, "" when empty)
+    """
+    cells = [[] for _ in bounds]
+    for word in sorted(line_words, key=lambda w: w["x0"]):
+        centre = (word["x0"] + word["x1"]) / 2
+        idx = 0
+        for i, x0 in enumerate(bounds):
+            if centre >= x0:
+                idx = i
+        cells[idx].append(word["text"])
+    return [" ".join(c) for c in cells]
+
+
+def _is_header(cells, patterns):
+    """
+    True when every band of the line matches its profile header pattern.
+    """
+    return all(
+        p.match(cell.strip().lower()) for cell, p in zip(cells, patterns)
+    )
+
+
+# -----------------------------
+# PDFIUM WORD SOURCE
+# -----------------------------
+# Same word-splitting rule as pdfplumber.extract_words (x_tolerance=3)
+WORD_X_TOLERANCE = 3
+WORD_Y_TOLERANCE = 3
+
+
+class _PdfiumPage:
+    """
+    Page wrapper returning pdfplumber-shaped word dicts
+    (text, x0, x1, top, bottom) from pdfium's C text layer, which skips
+    pdfminer's layout analysis (the bulk of pdfplumber's parse time).
+    """
+
+    def __init__(self, page):
+        self._page = page
+
+    def extract_words(self, **kwargs):
+        height = self._page.get_height()
+        textpage = self._page.get_textpage()
+
+        words = []
+        current = None
+        try:
+            for i in range(textpage.count_chars()):
+                code = pdfium_raw.FPDFText_GetUnicode(textpage.raw, i)
+                if code <= 32 or pdfium_raw.FPDFText_IsGenerated(textpage.raw, i) == 1:
+                    current = None
+                    continue
+
+                left, bottom, right, top = textpage.get_charbox(i, loose=True)
+                char_top, char_bottom = height - top, height - bottom
+
+                if (
+                    current is None
+                    or abs(char_top - current["top"]) > WORD_Y_TOLERANCE
+                    or abs(left - current["x1"]) > WORD_X_TOLERANCE
+                ):
+                    current = {"text": "", "x0": left, "x1": right,
+                               "top": char_top, "bottom": char_bottom}
+                    words.append(current)
+
+                current["text"] += chr(code)
+                current["x1"] = right
+        finally:
+            textpage.close()
+
+        return words
+
+
+class _PdfiumDocument:
+    def __init__(self, doc):
+        self._doc = doc
+
+    @property
+    def pages(self):
+        # Lazy: a layout miss on page 1 never loads the rest
+        for i in range(len(self._doc)):
+            page = self._doc[i]
+            try:
+                yield _PdfiumPage(page)
+            finally:
+                page.close()
+
+
+def extract_layout_from_source(source, layout: str = "BOI") -> pd.DataFrame:
+    """
+    Runs extract_with_layout on a PDF path or seekable stream using the
+    pdfium word source. Stream position is restored for the caller.
+    """
+    start = source.tell() if hasattr(source, "tell") else None
+
+    doc = pdfium.PdfDocument(source)
+    try:
+        return extract_with_layout(_PdfiumDocument(doc), layout)
+    finally:
+        doc.close()
+        if start is not None:
+            source.seek(start)
+
+
+# -----------------------------
+# MAIN EXTRACTOR
+# -----------------------------
+def extract_with_layout(pdf, layout: str = "BOI") -> pd.DataFrame:
+    """
+    Extracts statement rows from the word stream of a document (anything
+    whose pages have pdfplumber's `extract_words`) using the fixed column
+    boundaries of a layout profile.
+
+    - The header fingerprint is strict: each band of the header line must
+      match that column's pattern, and it must appear on page 1
+    - Lines above the (repeated) table header on every page are skipped
+    - A line with a date in the date column starts a new transaction
+    - A line with text only in the continuation column, directly below
+      the previous row, extends its remarks (joined with "\\n", like
+      extract_table)
+    - Any other line (totals, footers, "End of Statement") ends the table
+      until the header is seen again
+
+    Returns:
+        DataFrame with the profile's column names,
+        or an empty DataFrame when the layout does not match
+    """
+    profile = LAYOUT_PROFILES[layout]
+    names = [name for name, _, _ in profile["columns"]]
+    bounds = [x0 for _, x0, _ in profile["columns"]]
+    patterns = [re.compile(p) for _, _, p in profile["columns"]]
+    date_idx = names.index(profile["date_column"])
+    cont_idx = names.index(profile["continuation_column"])
+    date_re = re.compile(profile["date_pattern"])
+
+    matched = False
+    rows = []
+
+    for page_no, page in enumerate(pdf.pages):
+        words = page.extract_words(keep_blank_chars=False, use_text_flow=False)
+        in_table = False
+        last_top = last_height = last_x0 = None
+
+        for line_words in _group_lines(words, profile["line_tolerance"]):
+            cells = _split_columns(line_words, bounds)
+            top = min(w["top"] for w in line_words)
+            height = max(w["bottom"] - w["top"] for w in line_words)
+            x0 = min(w["x0"] for w in line_words)
+
+            if _is_header(cells, patterns):
+                matched = in_table = True
+                last_top = None
+                continue
+
+            if not in_table:
+                continue
+
+            date_cell = cells[date_idx].split(" ")[0]
+            only_continuation = all(
+                not c for i, c in enumerate(cells) if i != cont_idx
+            )
+
+            if date_re.match(date_cell):
+                rows.append(cells)
+                last_top, last_height = top, height
+                last_x0 = min(
+                    (w["x0"] for w in line_words
+                     if bounds[cont_idx] <= (w["x0"] + w["x1"]) / 2 < bounds[cont_idx + 1]),
+                    default=None,
+                )
+            elif (
+                only_continuation
+                and last_top is not None
+                and top - last_top <= profile["continuation_spacing"] * last_height
+                and (last_x0 is None or abs(x0 - last_x0) <= profile["continuation_indent"])
+            ):
+                prev = rows[-1][cont_idx]
+                rows[-1][cont_idx] = f"{prev}\n{cells[cont_idx]}" if prev else cells[cont_idx]
+                last_top = top
+            else:
+                in_table = False
+                last_top = None
+
+        # Not this layout: stop before scanning the rest of the document
+        if page_no == 0 and not matched:
+            return pd.DataFrame()
+
+    if not rows:
+        return pd.DataFrame()
+
+    return pd.DataFrame(rows, columns=names)
@@ -0,0 +1,326 @@
+# Path: tools/recurring_analysis.py
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import (
+    MetaData, Table, Column, Integer, String, Float, DateTime, func, inspect, select, text
+)
+
+# -----------------------------
+# DETECTION SETTINGS
+# -----------------------------
+# name -> (expected gap in days, tolerance in days)
+PERIODS = {
+    "WEEKLY": (7, 2),
+    "MONTHLY": (30, 4),
+    "QUARTERLY": (91, 10),
+    "YEARLY": (365, 15),
+}
+
+MIN_OCCURRENCES = 3
+MAX_GAP_DISPERSION = 0.25     # MAD of gaps / median gap
+MAX_AMOUNT_DISPERSION = 0.20  # MAD of amounts / median amount
+ROLLING_WINDOW = 10           # previous transactions used as baseline
+MIN_BASELINE = 3
+ANOMALY_Z = 3.0
+# z-score scale >= 25% of the baseline mean: after a steady run, an
+# amount is flagged only above 1 + ANOMALY_Z * 0.25 = 1.75x the baseline
+# (a 199 -> 260 price rise is not an anomaly, 199 -> 400 is)
+MIN_SCALE_RATIO = 0.25
+
+# -----------------------------
+# DERIVED TABLE
+# -----------------------------
+metadata = MetaData()
+
+insights_table = Table(
+    "fact_transaction_insights",
+    metadata,
+    Column("insight_id", Integer, primary_key=True, autoincrement=True),
+    Column("session_id", String(64), nullable=False, index=True),
+    Column("insight_type", String(20), nullable=False),   # RECURRING | ANOMALY
+    Column("counterparty_name", String(255)),
+    Column("txn_date", DateTime),
+    Column("amount", Float),
+    Column("period", String(20)),
+    Column("period_days", Float),
+    Column("occurrences", Integer),
+    Column("score", Float),
+    Column("created_at", DateTime, server_default=func.current_timestamp()),
+    schema="dbo",
+)
+
+
+def create_insights_table():
+    """
+    One-time setup step (needs CREATE TABLE rights):
+        python -m tools.recurring_analysis
+    """
+    from database.connection import engine
+
+    with engine.begin() as conn:
+        metadata.create_all(conn, tables=[insights_table], checkfirst=True)
+
+
+def insights_table_exists(conn) -> bool:
+    return inspect(conn).has_table(insights_table.name, schema=insights_table.schema)
+
+
+def delete_insights(conn, session_id=None):
+    """
+    Removes derived rows for one session (or all when session_id is None).
+    A missing table (setup not run yet) is treated as nothing to delete.
+
+    Returns:
+        number of rows deleted
+    """
+    if not insights_table_exists(conn):
+        return 0
+
+    stmt = insights_table.delete()
+    if session_id:
+        stmt = stmt.where(insights_table.c.session_id == session_id)
+    return conn.execute(stmt).rowcount
+
+
+# -----------------------------
+# HELPERS
+# -----------------------------
+def normalize_counterparty(names: pd.Series) -> pd.Series:
+    """
+    Upper-cases and strips digits / punctuation so that
+    'Netflix.com 0421' and 'NETFLIXCOM' group together.
+    """
+    return (
+        names.fillna("")
+        .astype(str)
+        .str.upper()
+        .str.replace(r"[^A-Z]", "", regex=True)
+        .replace({"": "UNKNOWN"})
+    )
+
+
+def _grouped_mad(values: pd.Series, keys: pd.Series, centres: pd.Series) -> pd.Series:
+    """
+    Median absolute deviation of values around their key's centre
+    (centres indexed by key).
+    """
+    deviation = np.abs(values.to_numpy() - centres.reindex(keys).to_numpy())
+    return pd.Series(deviation, index=keys.to_numpy()).groupby(level=0).median()
+
+
+def _load_session(session_id: str) -> pd.DataFrame:
+    # 🔧 LAZY IMPORT (detection functions stay usable without DB config)
+    from database.connection import engine
+
+    query = text("""
+        SELECT txn_date, counterparty_name, debit
+        FROM FACT_TRANSACTIONS
+        WHERE session_id = :sid AND debit > 0
+    """)
+    with engine.connect() as conn:
+        df = pd.read_sql(query, conn, params={"sid": session_id})
+
+    df["txn_date"] = pd.to_datetime(df["txn_date"], errors="coerce")
+    return df.dropna(subset=["txn_date"])
+
+
+# -----------------------------
+# RECURRING PAYMENTS
+# -----------------------------
+def detect_recurring(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Finds periodic debits per normalized counterparty.
+
+    One sort + groupby pass: inter-arrival gaps come from a grouped diff,
+    gap regularity and amount stability both from the median absolute
+    deviation, so a single odd charge does not hide a subscription.
+
+    Args:
+        df: columns txn_date, counterparty, debit
+
+    Returns:
+        one row per recurring counterparty
+    """
+    df = df[df["counterparty"] != "UNKNOWN"].sort_values(["counterparty", "txn_date"])
+    if df.empty:
+        return pd.DataFrame()
+
+    grouped = df.groupby("counterparty", sort=False)
+    df = df.assign(gap=grouped["txn_date"].diff().dt.total_seconds() / 86400)
+
+    stats = df.groupby("counterparty", sort=False).agg(
+        occurrences=("debit", "size"),
+        amount=("debit", "median"),
+        period_days=("gap", "median"),
+        last_date=("txn_date", "max"),
+    )
+    stats = stats[stats["occurrences"] >= MIN_OCCURRENCES]
+    if stats.empty:
+        return pd.DataFrame()
+
+    df = df[df["counterparty"].isin(stats.index)]
+    gaps = df.dropna(subset=["gap"])
+    gap_mad = _grouped_mad(gaps["gap"], gaps["counterparty"], stats["period_days"])
+    amount_mad = _grouped_mad(df["debit"], df["counterparty"], stats["amount"])
+    stats["gap_dispersion"] = gap_mad.reindex(stats.index) / stats["period_days"]
+    stats["amount_dispersion"] = amount_mad.reindex(stats.index) / stats["amount"]
+
+    # Match the median gap against known periods (vectorized over periods)
+    names = np.array(list(PERIODS))
+    expected = np.array([p[0] for p in PERIODS.values()], dtype=float)
+    tolerance = np.array([p[1] for p in PERIODS.values()], dtype=float)
+    distance = np.abs(stats["period_days"].to_numpy()[:, None] - expected[None, :])
+    best = distance.argmin(axis=1)
+    within = distance[np.arange(len(best)), best] <= tolerance[best]
+
+    stats["period"] = np.where(within, names[best], None)
+
+    recurring = stats[
+        within
+        & (stats["gap_dispersion"] <= MAX_GAP_DISPERSION)
+        & (stats["amount_dispersion"] <= MAX_AMOUNT_DISPERSION)
+    ]
+
+    return pd.DataFrame({
+        "insight_type": "RECURRING",
+        "counterparty_name": recurring.index,
+        "txn_date": recurring["last_date"].to_numpy(),
+        "amount": recurring["amount"].round(2).to_numpy(),
+        "period": recurring["period"].to_numpy(),
+        "period_days": recurring["period_days"].to_numpy(),
+        "occurrences": recurring["occurrences"].to_numpy(),
+        # 1.0 = perfectly regular in both timing and amount
+        "score": (1 - recurring[["gap_dispersion", "amount_dispersion"]].max(axis=1)).round(4).to_numpy(),
+    })
+
+
+# -----------------------------
+# ANOMALIES
+# -----------------------------
+def _rolling_z(amounts: pd.Series, keys) -> pd.Series:
+    """
+    z-score of each amount against the rolling mean/std of the previous
+    ROLLING_WINDOW amounts within the same key (current row excluded).
+
+    The scale is floored at MIN_SCALE_RATIO * |mean| so a spike after a
+    perfectly steady run (std = 0) still scores instead of becoming NaN.
+    """
+    previous = amounts.groupby(keys).shift(1)
+    rolling = previous.groupby(keys).rolling(ROLLING_WINDOW, min_periods=MIN_BASELINE)
+    mean = rolling.mean().reset_index(level=0, drop=True).reindex(amounts.index)
+    std = rolling.std().reset_index(level=0, drop=True).reindex(amounts.index)
+    scale = np.maximum(std, MIN_SCALE_RATIO * mean.abs())
+    return (amounts - mean) / scale.where(scale > 0)
+
+
+def detect_anomalies(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Flags debit spikes against rolling statistics, both per counterparty
+    and across the whole session; the larger z-score wins.
+
+    Args:
+        df: columns txn_date, counterparty, debit
+
+    Returns:
+        one row per anomalous transaction
+    """
+    if df.empty:
+        return pd.DataFrame()
+
+    df = df.sort_values(["counterparty", "txn_date"]).reset_index(drop=True)
+    z_party = _rolling_z(df["debit"], df["counterparty"].to_numpy())
+
+    session_keys = np.zeros(len(df), dtype=int)
+    by_date = df.sort_values("txn_date")
+    z_session = _rolling_z(by_date["debit"], session_keys).reindex(df.index)
+
+    score = pd.concat([z_party, z_session], axis=1).max(axis=1)
+    flagged = df[score > ANOMALY_Z]
+
+    return pd.DataFrame({
+        "insight_type": "ANOMALY",
+        "counterparty_name": flagged["counterparty"].to_numpy(),
+        "txn_date": flagged["txn_date"].to_numpy(),
+        "amount": flagged["debit"].to_numpy(),
+        "period": None,
+        "period_days": None,
+        "occurrences": None,
+        "score": score[flagged.index].round(4).to_numpy(),
+    })
+
+
+# -----------------------------
+# MAIN ENTRY POINTS
+# -----------------------------
+def analyse_session(session_id: str) -> dict:
+    """
+    Runs recurring-payment and anomaly detection for one session and
+    replaces its rows in fact_transaction_insights.
+
+    Returns:
+        counts per insight type
+
+    Raises:
+        RuntimeError: fact_transaction_insights has not been created
+    """
+    from database.connection import engine
+
+    df = _load_session(session_id)
+    df["counterparty"] = normalize_counterparty(df["counterparty_name"])
+
+    insights = pd.concat(
+        [detect_recurring(df), detect_anomalies(df)],
+        ignore_index=True,
+    )
+
+    records = []
+    if not insights.empty:
+        insights["session_id"] = session_id
+        insights = insights.astype(object).where(insights.notna(), None)
+        # numpy scalars -> python types for the DB driver
+        records = [
+            {k: (v.item() if isinstance(v, np.generic) else v) for k, v in r.items()}
+            for r in insights.to_dict("records")
+        ]
+
+    with engine.begin() as conn:
+        if not insights_table_exists(conn):
+            raise RuntimeError(
+                "fact_transaction_insights is missing; "
+                "run `python -m tools.recurring_analysis` once to create it"
+            )
+        delete_insights(conn, session_id)
+        if records:
+            conn.execute(insights_table.insert(), records)
+
+    recurring = sum(1 for r in records if r["insight_type"] == "RECURRING")
+    return {
+        "recurring": recurring,
+        "anomalies": len(records) - recurring,
+    }
+
+
+def get_session_insights(session_id: str) -> list:
+    """
+    Returns stored insights of one session (empty when not analysed).
+    Read-only: a missing table also returns an empty list.
+    """
+    from database.connection import engine
+
+    query = (
+        select(insights_table)
+        .where(insights_table.c.session_id == session_id)
+        .order_by(insights_table.c.insight_type, insights_table.c.txn_date)
+    )
+
+    with engine.connect() as conn:
+        if not insights_table_exists(conn):
+            return []
+        return [dict(row._mapping) for row in conn.execute(query)]
+
+
+# Run directly for one-time setup
+if __name__ == "__main__":
+    create_insights_table()
+    print("✅ fact_transaction_insights ready")
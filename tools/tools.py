@@ -2,8 +2,57 @@
 
 import pandas as pd
 import pdfplumber
+import openpyxl
 import re
 import os
+import io
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+from tools.pdf_layouts import extract_layout_from_source
+
+class MemoryReader(io.RawIOBase):
+    """
+    Seekable read-only file object over a bytes-like buffer.
+    Slices a memoryview instead of copying, so pandas / pdfplumber can
+    read an upload (or an mmap of it) without a temp file.
+    """
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast("B")
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        chunk = self._view[self._pos:self._pos + len(b)]
+        n = len(chunk)
+        b[:n] = chunk
+        self._pos += n
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def close(self):
+        # Buffer is owned by the caller; only drop our view
+        self._view.release()
+        super().close()
+
 
 class DataTransformer:
     """
@@ -25,22 +74,169 @@ class DataTransformer:
         "bal": "balance"
     }
 
-    def parse_file(self, file_path: str, file_ext: str) -> pd.DataFrame:
-        if file_ext == ".csv":
-            df = pd.read_csv(file_path)
-        elif file_ext in [".xls", ".xlsx"]:
-            df = pd.read_excel(file_path)
-        elif file_ext == ".pdf":
-            df = self._parse_pdf(file_path)
-        else:
+    # Layout profile tried before generic table detection (None = generic only)
+    PDF_LAYOUT = "BOI"
+
+    # Streaming spreadsheet reader (falls back to pd.read_excel when off/unmatched)
+    FAST_EXCEL = True
+    EXCEL_CHUNK_SIZE = 10000
+    HEADER_SCAN_ROWS = 30
+
+    def parse_file(self, source, file_ext: str) -> pd.DataFrame:
+        """
+        Args:
+            source: file path, or bytes-like buffer (bytes / memoryview / mmap)
+            file_ext (str): .csv | .xls | .xlsx | .pdf
+        """
+        if file_ext not in [".csv", ".xls", ".xlsx", ".pdf"]:
             raise ValueError(f"Unsupported format: {file_ext}")
 
-        return self._clean_dataframe(df)
+        if isinstance(source, (str, os.PathLike)):
+            return self._parse_source(source, file_ext)
+
+        with io.BufferedReader(MemoryReader(source)) as reader:
+            return self._parse_source(reader, file_ext)
+
+    def _parse_source(self, source, file_ext: str) -> pd.DataFrame:
+        if file_ext in [".xls", ".xlsx"] and self.FAST_EXCEL:
+            df = self._parse_excel_fast(source, file_ext)
+            if df is not None:
+                return df
+            if hasattr(source, "seek"):
+                source.seek(0)
+
+        return self._clean_dataframe(self._read_source(source, file_ext))
+
+    def _read_source(self, source, file_ext: str) -> pd.DataFrame:
+        if file_ext == ".csv":
+            return pd.read_csv(source)
+        if file_ext in [".xls", ".xlsx"]:
+            return pd.read_excel(source)
+        return self._parse_pdf(source)
+
+    def _iter_excel_rows(self, source, file_ext: str):
+        """
+        Streams first-sheet rows as tuples without building the workbook
+        object model. Prefers calamine (xls + xlsx) when installed, else
+        openpyxl read-only mode (xlsx only).
+
+        Returns:
+            row iterator, or None when no streaming reader fits
+        """
+        try:
+            from python_calamine import CalamineWorkbook
+        except ImportError:
+            CalamineWorkbook = None
 
-    def _parse_pdf(self, path: str) -> pd.DataFrame:
+        if CalamineWorkbook is not None:
+            if isinstance(source, (str, os.PathLike)):
+                wb = CalamineWorkbook.from_path(str(source))
+            else:
+                wb = CalamineWorkbook.from_filelike(source)
+            return wb.get_sheet_by_index(0).iter_rows()
+
+        if file_ext == ".xlsx":
+            wb = openpyxl.load_workbook(source, read_only=True, data_only=True)
+
+            def _rows():
+                try:
+                    yield from wb.worksheets[0].iter_rows(values_only=True)
+                finally:
+                    wb.close()
+
+            return _rows()
+
+        return None
+
+    def _match_header(self, row) -> dict:
+        """
+        Maps cell index -> canonical column for a candidate header row.
+        Only columns the pipeline uses are kept.
+        """
+        targets = set(self.CANONICAL_MAP.values())
+        mapped = {}
+
+        for idx, cell in enumerate(row):
+            name = str(cell).strip().lower() if cell is not None else ""
+            canonical = self.CANONICAL_MAP.get(name, name)
+            if canonical in targets and canonical not in mapped.values():
+                mapped[idx] = canonical
+
+        if "transaction_date" in mapped.values() and len(mapped) >= 3:
+            return mapped
+        return {}
+
+    def _parse_excel_fast(self, source, file_ext: str):
+        rows = self._iter_excel_rows(source, file_ext)
+        if rows is None:
+            return None
+
+        # Header sits below bank banner rows (name, address, period ...)
+        mapped = {}
+        for i, row in enumerate(rows):
+            mapped = self._match_header(row)
+            if mapped or i + 1 >= self.HEADER_SCAN_ROWS:
+                break
+
+        if not mapped:
+            if hasattr(rows, "close"):
+                rows.close()
+            return None
+
+        indices = list(mapped)
+        names = [mapped[i] for i in indices]
+
+        chunks, batch = [], []
+        date_format = None
+
+        def _flush():
+            nonlocal date_format
+            # Typed cells (floats, datetimes) keep their dtype; text stays object
+            df = pd.DataFrame(batch, columns=names).infer_objects()
+            # Text dates: fix the format once so every chunk parses alike
+            if date_format is None:
+                date_format = self._guess_date_format(df)
+            chunks.append(self._clean_dataframe(df, date_format))
+
+        for row in rows:
+            batch.append([row[i] if i < len(row) else None for i in indices])
+            if len(batch) >= self.EXCEL_CHUNK_SIZE:
+                _flush()
+                batch = []
+
+        if batch or not chunks:
+            _flush()
+
+        return pd.concat(chunks, ignore_index=True)
+
+    def _guess_date_format(self, df: pd.DataFrame):
+        """
+        strftime format of the first text date in the frame, or None
+        (no text dates yet / not guessable).
+        """
+        if "transaction_date" not in df.columns:
+            return None
+
+        first = next(
+            (v.strip() for v in df["transaction_date"] if isinstance(v, str) and v.strip()),
+            None,
+        )
+        if first is None:
+            return None
+
+        return guess_datetime_format(first)
+
+    def _parse_pdf(self, source) -> pd.DataFrame:
         rows = []
 
-        with pdfplumber.open(path) as pdf:
+        # Fast path: pdfium word stream + fixed columns for known layouts
+        # (gives up after page 1 when the layout header does not match)
+        if self.PDF_LAYOUT:
+            df = extract_layout_from_source(source, self.PDF_LAYOUT)
+            if not df.empty:
+                return df
+
+        with pdfplumber.open(source) as pdf:
             for page in pdf.pages:
                 table = page.extract_table()
                 if table:
@@ -50,20 +246,26 @@ class DataTransformer:
             return pd.DataFrame()
 
         headers = rows[0]
-        data = rows[1:]
+        # Drop header rows repeated at the top of later pages
+        data = [r for r in rows[1:] if r != headers]
         return pd.DataFrame(data, columns=headers)
 
-    def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _clean_dataframe(self, df: pd.DataFrame, date_format=None) -> pd.DataFrame:
         df.columns = [str(c).strip().lower() for c in df.columns]
         df.rename(columns=lambda c: self.CANONICAL_MAP.get(c, c), inplace=True)
 
         df.dropna(how="all", inplace=True)
 
         if "transaction_date" in df.columns:
-            df["transaction_date"] = pd.to_datetime(df["transaction_date"], errors="coerce")
+            df["transaction_date"] = pd.to_datetime(
+                df["transaction_date"], format=date_format, errors="coerce"
+            )
 
         for col in ["debit", "credit", "balance"]:
-            if col in df.columns:
+            if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
+                # Already typed (e.g. spreadsheet cells): skip string cleanup
+                df[col] = df[col].fillna(0)
+            elif col in df.columns:
                 df[col] = (
                     df[col]
                     .astype(str)